@@ -352,6 +352,7 @@ pub fn app(cx: Scope<AppProps>) -> Element {
                                 label {
                                     input {
                                         r#type: "checkbox",
+                                        "data-kind": "slow",
                                         checked: "{test_config.simulate_slow}",
                                         onchange: move |e| {
                                             let mut config = test_config.get().clone();
@@ -370,6 +371,7 @@ pub fn app(cx: Scope<AppProps>) -> Element {
                                     "Delay (ms): "
                                     input {
                                         r#type: "range",
+                                        "data-kind": "delay",
                                         min: "500",
                                         max: "5000",
                                         step: "500",
@@ -391,6 +393,7 @@ pub fn app(cx: Scope<AppProps>) -> Element {
                                 label {
                                     input {
                                         r#type: "checkbox",
+                                        "data-kind": "lockup",
                                         checked: "{test_config.simulate_lockup}",
                                         onchange: move |e| {
                                             let mut config = test_config.get().clone();